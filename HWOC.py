@@ -6,9 +6,11 @@ HWOC v0.2b — Hardware Online Check (Optimized)
 """
 
 import argparse
+import asyncio
 import concurrent.futures
 import contextlib
 import datetime as dt
+import functools
 import hashlib
 import json
 import os
@@ -16,10 +18,13 @@ import platform
 import random
 import re
 import sys
+import threading
 import time
 import urllib.parse as up
 from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from types import SimpleNamespace
+from typing import AbstractSet, Any, Callable, Dict, Generator, List, Optional, Tuple
 
 # --- Third-party imports with a clear failure message ---
 try:
@@ -29,20 +34,52 @@ except ImportError:
     sys.exit(1)
 
 try:
-    import wmi  # Windows Management Instrumentation binding
+    # Raw WMI access over COM (pywin32); avoids the wmi package's per-attribute proxies
+    import pythoncom
+    import pywintypes
+    import win32com.client
 except ImportError:
-    print("[FATAL] wmi is required on Windows. Install with: pip install wmi", file=sys.stderr)
+    print("[FATAL] pywin32 is required on Windows. Install with: pip install pywin32", file=sys.stderr)
     sys.exit(1)
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
 except ImportError:
     print("[FATAL] requests and beautifulsoup4 are required. Install with: pip install requests beautifulsoup4", file=sys.stderr)
     sys.exit(1)
 
+# Optional async HTTP client; without it enrichment falls back to the thread pool
 try:
-    from rich.console import Console
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional fast JSON serializer; dataclasses are serialized natively without asdict()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional fast HTML parsers: selectolax's lexbor backend (C) first, then lxml for BeautifulSoup.
+# Only lexbor is used; the legacy Modest backend (selectolax.parser) is deprecated and
+# raises ImportError on selectolax >= 1.0.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+try:
+    from rich.console import Console, Group
     from rich.table import Table
     from rich.panel import Panel
     from rich import box
@@ -56,8 +93,10 @@ except ImportError:
 
 APP_NAME = "HWOC v0.2b"
 # Cache directory for online lookups to reduce repeated downloads
-CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache\\hwoc")
-os.makedirs(CACHE_DIR, exist_ok=True)
+# (created lazily on the first write, so offline runs never touch the disk)
+CACHE_DIR = Path.home() / ".cache" / "hwoc"
+# Cached specs older than this are revalidated against the origin server
+CACHE_TTL = 30 * 24 * 3600
 
 # A list of user agents to rotate, helping avoid trivial bot detection
 UA_LIST = [
@@ -66,6 +105,14 @@ UA_LIST = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
 ]
 
+# Precompiled patterns used on hot paths (scraped text, WMI strings)
+_WS_RE = re.compile(r"\s+")
+_VEN_RE = re.compile(r"VEN_([0-9A-F]{4})", re.I)
+_DEV_RE = re.compile(r"DEV_([0-9A-F]{4})", re.I)
+_GHZ_RE = re.compile(r"([\d.]+)\s*GHz", re.I)
+
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
 def now_utc_iso() -> str:
     """Returns a simplified ISO 8601 UTC timestamp."""
     t = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat()
@@ -74,33 +121,166 @@ def now_utc_iso() -> str:
         t = t[:-6] + "Z"
     return t
 
+# normspace and bytes_to_human see heavily repeated inputs (identical DIMMs, "N/A",
+# vendor names), so they are memoized.
+@functools.lru_cache(maxsize=4096)
 def normspace(s: Optional[str]) -> str:
     """Normalizes whitespace in a string."""
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WS_RE.sub(" ", s or "").strip()
 
 def safe_int(x: Any) -> Optional[int]:
     """Safely converts a value to an integer, returning None on failure."""
+    # WMI usually hands back native ints already; skip the try/except for them
+    if isinstance(x, int):
+        return x
     try:
         return int(x)
     except (ValueError, TypeError):
         return None
 
+def _cim_dt(v: Any) -> str:
+    """Converts a CIM datetime ("20230115000000.000000+000") to an ISO date string."""
+    if not v:
+        return ""
+    try:
+        return dt.datetime.strptime(str(v)[:14], "%Y%m%d%H%M%S").date().isoformat()
+    except ValueError:
+        return str(v)
+
 def sha1(s: str) -> str:
     """Computes the SHA-1 hash of a string."""
     return hashlib.sha1(s.encode("utf-8", "ignore")).hexdigest()
 
+@functools.lru_cache(maxsize=1024)
 def bytes_to_human(n: Optional[int]) -> str:
     """Converts a byte count to a human-readable format (e.g., GiB)."""
     if not n or n <= 0:
         return ""
-    step = 1024.0
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
-    i = 0
-    x = float(n)
-    while x >= step and i < len(units) - 1:
-        x /= step
-        i += 1
-    return f"{x:.1f} {units[i]}"
+    n = int(n)
+    # floor(log1024(n)) straight from the bit length, capped at the largest unit
+    i = min((n.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{n / (1 << (10 * i)):.1f} {_BYTE_UNITS[i]}"
+
+class DiskCache:
+    """A small on-disk JSON cache keyed by SHA-1 of the cache key.
+
+    Each entry stores the payload together with the ETag / Last-Modified
+    validators of the response it came from, so stale entries can be
+    revalidated with a conditional GET instead of a full download.
+    """
+    def __init__(self, root: Path, ttl: int = CACHE_TTL):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.root / (sha1(key) + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the raw cache entry (fresh or stale), or None if missing."""
+        try:
+            with self._path(key).open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "payload" in entry else None
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """Checks whether an entry is younger than the configured TTL."""
+        return bool(entry) and time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def set(self, key: str, data: Any, headers: Optional[Dict[str, str]] = None):
+        """Stores a payload with its HTTP validators. Failures are non-fatal."""
+        headers = headers or {}
+        entry = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "payload": data,
+        }
+        path = self._path(key)
+        # Unique per thread, as lookups for the same URL can be written concurrently
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+    def invalidate(self):
+        """Removes every cached entry."""
+        with contextlib.suppress(OSError):
+            for path in self.root.glob("*.json"):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+CACHE = DiskCache(CACHE_DIR)
+
+# --- HTML helpers (selectolax when available, BeautifulSoup otherwise) ---
+
+def parse_html(text: str) -> Any:
+    """Parses an HTML document with the fastest available backend."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(text)
+    return BeautifulSoup(text, BS4_PARSER)
+
+def css(node: Any, selector: str) -> List[Any]:
+    """Returns all nodes matching a CSS selector, in document order.
+
+    Both lexbor and soupsieve return matches for a selector list ("dt, dd, tr")
+    in document order rather than grouped per selector; extract_specs relies on it.
+    """
+    return node.css(selector) if LexborHTMLParser is not None else node.select(selector)
+
+def css_first(node: Any, selector: str) -> Any:
+    """Returns the first node matching a CSS selector, or None."""
+    return node.css_first(selector) if LexborHTMLParser is not None else node.select_one(selector)
+
+def node_text(node: Any) -> str:
+    """Returns the concatenated text of a node and its descendants."""
+    return node.text() if LexborHTMLParser is not None else node.get_text()
+
+def node_attr(node: Any, name: str) -> str:
+    """Returns an attribute value of a node, or an empty string."""
+    value = node.attributes.get(name) if LexborHTMLParser is not None else node.get(name)
+    return value or ""
+
+def node_tag(node: Any) -> str:
+    """Returns the lowercase tag name of a node."""
+    return (node.tag if LexborHTMLParser is not None else node.name) or ""
+
+def extract_specs(tree: Any, wanted: Optional[AbstractSet[str]] = None) -> Dict[str, str]:
+    """Extracts label/value pairs from <dt>/<dd> lists, falling back to table rows.
+
+    The document is walked once. When ``wanted`` is given, values are only read
+    for wanted labels and the walk stops once every wanted <dt> has been paired.
+    """
+    dl_specs: Dict[str, str] = {}
+    row_specs: Dict[str, str] = {}
+    remaining = set(wanted or ())
+    label = None
+    for el in css(tree, "dt, dd, tr"):
+        tag = node_tag(el)
+        if tag == "dt":
+            label = normspace(node_text(el))
+            if wanted is not None and label not in wanted:
+                label = None
+        elif tag == "dd":
+            if label is None:
+                continue
+            # Pair each <dt> with the <dd> that immediately follows it
+            dl_specs.setdefault(label, normspace(node_text(el)))
+            remaining.discard(label)
+            label = None
+            if wanted and not remaining:
+                break
+        elif not dl_specs and len(tds := css(el, "td, th")) >= 2:
+            key = normspace(node_text(tds[0]))
+            if wanted is None or key in wanted:
+                row_specs[key] = normspace(node_text(tds[1]))
+    return dl_specs or row_specs
 
 # --- Data Models (kept as-is for consistency) ---
 @dataclass
@@ -193,153 +373,440 @@ class Report:
 
 # --- Optimized Core Logic ---
 
+# When online enrichment runs: always, only for components WMI left incomplete, or never
+ENRICH_POLICIES = ("always", "missing", "never")
+
+# Spec labels kept from each source, to keep the output clean
+WANTED_CPU = frozenset({
+    "Total Cores", "Total Threads", "Max Turbo Frequency", "Processor Base Frequency", "Cache", "Bus Speed",
+    "TDP", "Lithography", "Max Memory Size", "Memory Types", "Max # of PCI Express Lanes", "Processor Graphics",
+})
+WANTED_GPU = frozenset({
+    "GPU Name", "GPU Variant", "Architecture", "Foundry", "Process Size", "TDP", "Transistors", "Die Size",
+    "Base Clock", "Boost Clock", "Memory Size", "Memory Type", "Memory Bus", "Bandwidth", "Release Date",
+})
+
+WMI_NAMESPACE = "winmgmts:root\\cimv2"
+# wbemFlagForwardOnly | wbemFlagReturnImmediately: stream rows instead of materializing the collection
+WBEM_FLAGS = 0x30
+
+# A scraper flow yields URLs, receives their bodies and returns an OnlineSpec-shaped dict
+SpecFlow = Generator[str, str, Dict[str, Any]]
+# A lookup source: (cache key, factory creating a fresh flow)
+SpecSource = Tuple[str, Callable[[], SpecFlow]]
+
+# WMI classes queried by collect_local: key -> (class, projected columns, WHERE clause).
+# Only the columns the data models consume are selected, to keep DCOM payloads small.
+WMI_QUERIES = {
+    "os": ("Win32_OperatingSystem", ("Caption", "Version", "BuildNumber", "OSArchitecture", "InstallDate"), ""),
+    "cpu": ("Win32_Processor", ("Name", "Manufacturer", "NumberOfCores", "NumberOfLogicalProcessors",
+                                "MaxClockSpeed", "ProcessorId"), ""),
+    "gpus": ("Win32_VideoController", ("Name", "DriverVersion", "AdapterRAM", "DriverDate", "PNPDeviceID"), ""),
+    "memory": ("Win32_PhysicalMemory", ("Capacity", "Speed", "Manufacturer", "PartNumber", "SerialNumber",
+                                        "FormFactor", "MemoryType"), ""),
+    "disks": ("Win32_DiskDrive", ("Model", "SerialNumber", "Size", "InterfaceType", "MediaType"), ""),
+    "motherboard": ("Win32_BaseBoard", ("Product", "Manufacturer", "SerialNumber"), ""),
+    "bios": ("Win32_BIOS", ("SMBIOSBIOSVersion", "SerialNumber", "ReleaseDate"), ""),
+}
+# NICs and their IP configuration are read together on one connection and joined on Index
+WMI_NIC_QUERY = ("Win32_NetworkAdapter", ("Index", "Name", "MACAddress", "Manufacturer", "NetConnectionStatus"),
+                 "PhysicalAdapter = TRUE")
+WMI_NIC_CONFIG_QUERY = ("Win32_NetworkAdapterConfiguration", ("Index", "IPAddress"), "IPEnabled = TRUE")
+
+# Retry policy shared by the requests and aiohttp drivers
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 class HardwareReporter:
     """Main class to handle all hardware collection and online enrichment."""
-    def __init__(self, timeout: int, max_workers: int):
-        self.wmi_c = wmi.WMI()
+    def __init__(self, timeout: int, max_workers: int, enrich_policy: str = "always"):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
         # Use a session for persistent connections and header management
         self.session = requests.Session()
         self.session.headers.update({
-            "User-Agent": random.choice(UA_LIST),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.7",
             "Connection": "keep-alive",
+            # urllib3 only advertises 'br' when a brotli decoder is installed
+            "Accept-Encoding": ACCEPT_ENCODING,
         })
+        # Size the connection pool to the worker count so keep-alive connections
+        # (and their TLS handshakes) are reused across every request in a run
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF, status_forcelist=HTTP_RETRY_STATUSES),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = timeout
         self.max_workers = max_workers
-
-    def _http_get(self, url: str) -> requests.Response:
-        """Performs an HTTP GET request with a session and error handling."""
-        response = self.session.get(url, timeout=self.timeout)
+        if enrich_policy not in ENRICH_POLICIES:
+            raise ValueError(f"enrich_policy must be one of {ENRICH_POLICIES}, got {enrich_policy!r}")
+        self.enrich_policy = enrich_policy
+        # In-process lookup results keyed like the disk cache ("intel:v2:<name>", ...)
+        self._memo: Dict[str, Dict[str, Any]] = {}
+        # Created per run by enrich_online_async, inside the running event loop
+        self.aio_session = None
+        self._aio_sem = None
+
+    @staticmethod
+    def _request_headers(cache_entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Builds per-request headers: a rotated User-Agent plus cache validators."""
+        # Rotate on every request so a run's requests don't share one fingerprint
+        headers = {"User-Agent": random.choice(UA_LIST)}
+        if cache_entry:
+            if cache_entry.get("etag"):
+                headers["If-None-Match"] = cache_entry["etag"]
+            if cache_entry.get("last_modified"):
+                headers["If-Modified-Since"] = cache_entry["last_modified"]
+        return headers
+
+    def _http_get(self, url: str, cache_entry: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Performs an HTTP GET request, made conditional when a cache entry is given."""
+        response = self.session.get(url, headers=self._request_headers(cache_entry), timeout=self.timeout)
         response.raise_for_status()
         return response
 
+    def _cached_get(self, url: str) -> str:
+        """Fetches a response body, revalidating against a stored copy when there is one.
+
+        Raw bodies are never served without asking the origin: the stored ETag /
+        Last-Modified turn the request into a conditional GET, and the stored body
+        is only reused on a 304. The parsed-spec cache provides the 0-RTT path.
+        """
+        key = f"http:{url}"
+        entry = CACHE.get(key)
+        response = self._http_get(url, cache_entry=entry)
+        return self._store_body(key, entry, response.status_code, response.text, response.headers)
+
+    @staticmethod
+    def _store_body(key: str, entry: Optional[Dict[str, Any]], status: int, body: str, headers: Any) -> str:
+        """Records a response body with its validators; on a 304 returns the stored body."""
+        if status == 304 and entry:
+            # Not modified: keep the cached body and refresh its timestamp. A 304 need
+            # not repeat ETag / Last-Modified, so keep the stored ones when it omits them.
+            CACHE.set(key, entry["payload"], {
+                "ETag": headers.get("ETag") or entry.get("etag"),
+                "Last-Modified": headers.get("Last-Modified") or entry.get("last_modified"),
+            })
+            return entry["payload"]
+        if headers.get("ETag") or headers.get("Last-Modified"):
+            # Without validators a stored body could never be revalidated, so skip it
+            CACHE.set(key, body, headers)
+        return body
+
+    async def _http_get_async(self, url: str, cache_entry: Optional[Dict[str, Any]] = None):
+        """Async counterpart of _http_get. Returns (status, body, headers); body is empty on 304.
+
+        Mirrors the requests adapter's Retry policy: connection errors, timeouts and
+        HTTP_RETRY_STATUSES are retried up to HTTP_RETRIES times with urllib3-style
+        exponential backoff (no delay before the first retry).
+        """
+        for attempt in range(HTTP_RETRIES + 1):
+            if attempt > 1:
+                await asyncio.sleep(HTTP_BACKOFF * 2 ** (attempt - 1))
+            try:
+                async with self._aio_sem:
+                    async with self.aio_session.get(url, headers=self._request_headers(cache_entry)) as r:
+                        if r.status == 304:
+                            return r.status, "", r.headers
+                        if r.status in HTTP_RETRY_STATUSES and attempt < HTTP_RETRIES:
+                            continue
+                        r.raise_for_status()
+                        return r.status, await r.text(), r.headers
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == HTTP_RETRIES:
+                    raise
+
+    async def _cached_get_async(self, url: str) -> str:
+        """Async counterpart of _cached_get, sharing the same disk cache entries."""
+        key = f"http:{url}"
+        entry = CACHE.get(key)
+        status, body, headers = await self._http_get_async(url, cache_entry=entry)
+        return self._store_body(key, entry, status, body, headers)
+
+    def _cache_peek(self, key: str) -> Dict[str, Any]:
+        """Returns a cached lookup result from memory, then disk, or {} on a miss."""
+        if data := self._memo.get(key):
+            return data
+        entry = CACHE.get(key)
+        if CACHE.is_fresh(entry) and entry["payload"]:
+            self._memo[key] = entry["payload"]
+            return entry["payload"]
+        return {}
+
+    def _cache_store(self, key: str, data: Any) -> Dict[str, Any]:
+        """Stores a non-empty lookup result in memory and on disk."""
+        if not isinstance(data, dict):
+            return {}
+        if data:
+            self._memo[key] = data
+            CACHE.set(key, data)
+        return data
+
     def _cache_or_fetch_json(self, key: str, fetch_fn) -> Dict[str, Any]:
         """Checks cache, then fetches data if not found, and caches the result."""
-        cached = CACHE.get(key)
-        if cached:
-            return cached
-        data = fetch_fn()
-        if isinstance(data, dict):
-            CACHE.set(key, data)
-            return data
+        return self._cache_peek(key) or self._cache_store(key, fetch_fn())
+
+    async def _cache_or_fetch_json_async(self, key: str, fetch_coro_fn) -> Dict[str, Any]:
+        """Async counterpart of _cache_or_fetch_json."""
+        return self._cache_peek(key) or self._cache_store(key, await fetch_coro_fn())
+
+    def cache_clear(self):
+        """Drops every cached lookup, in memory and on disk."""
+        self._memo.clear()
+        CACHE.invalidate()
+
+    # The scrapers below are written as generators ("flows"): they yield each URL
+    # they need and receive its body back, so the same parsing code is driven by
+    # either the blocking requests session or the aiohttp session.
+
+    def _run_flow(self, flow: SpecFlow) -> Dict[str, Any]:
+        """Drives a scraper flow with blocking HTTP requests."""
+        try:
+            url = next(flow)
+            while True:
+                try:
+                    body = self._cached_get(url)
+                except Exception as e:
+                    url = flow.throw(e)
+                else:
+                    url = flow.send(body)
+        except StopIteration as stop:
+            return stop.value or {}
+
+    async def _run_flow_async(self, flow: SpecFlow) -> Dict[str, Any]:
+        """Drives a scraper flow with aiohttp requests."""
+        try:
+            url = next(flow)
+            while True:
+                try:
+                    body = await self._cached_get_async(url)
+                except Exception as e:
+                    url = flow.throw(e)
+                else:
+                    url = flow.send(body)
+        except StopIteration as stop:
+            return stop.value or {}
+
+    def _lookup(self, sources: List[SpecSource]) -> Dict[str, Any]:
+        """Tries each (cache key, flow factory) source in order; first non-empty result wins."""
+        for key, make_flow in sources:
+            if data := self._cache_or_fetch_json(key, lambda: self._run_flow(make_flow())):
+                return data
         return {}
 
-    def _wikipedia_summary(self, title: str) -> Dict[str, Any]:
+    async def _lookup_async(self, sources: List[SpecSource]) -> Dict[str, Any]:
+        """Async counterpart of _lookup."""
+        for key, make_flow in sources:
+            if data := await self._cache_or_fetch_json_async(key, lambda: self._run_flow_async(make_flow())):
+                return data
+        return {}
+
+    def _wikipedia_flow(self, title: str) -> SpecFlow:
         """Fetches a summary from Wikipedia as a robust fallback."""
-        def fetch():
-            try:
-                # Use the MediaWiki API for a structured search and summary
-                q = up.quote(title)
-                url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={q}&format=json&srlimit=1"
-                j = self._http_get(url).json()
-                pageid = j.get("query", {}).get("search", [{}])[0].get("pageid")
-                if not pageid:
-                    return {}
-
-                url2 = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts&explaintext=1&pageids={pageid}&format=json"
-                j2 = self._http_get(url2).json()
-                pages = j2.get("query", {}).get("pages", {})
-                extract = pages.get(str(pageid), {}).get("extract", "")
-                fullurl = f"https://en.wikipedia.org/?curid={pageid}"
-                return {"source": "wikipedia", "official_url": fullurl, "fields": {"summary": extract[:1200]}}
-            except Exception:
+        try:
+            # Use the MediaWiki API for a structured search and summary
+            q = up.quote(title)
+            url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={q}&format=json&srlimit=1"
+            j = json.loads((yield url))
+            pageid = j.get("query", {}).get("search", [{}])[0].get("pageid")
+            if not pageid:
                 return {}
-        return self._cache_or_fetch_json(f"wikipedia:{title}", fetch)
 
-    def _intel_ark_specs(self, cpu_name: str) -> Dict[str, Any]:
+            url2 = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts&explaintext=1&pageids={pageid}&format=json"
+            j2 = json.loads((yield url2))
+            pages = j2.get("query", {}).get("pages", {})
+            extract = pages.get(str(pageid), {}).get("extract", "")
+            fullurl = f"https://en.wikipedia.org/?curid={pageid}"
+            return {"source": "wikipedia", "official_url": fullurl, "fields": {"summary": extract[:1200]}}
+        except Exception:
+            return {}
+
+    def _intel_ark_flow(self, cpu_name: str) -> SpecFlow:
         """Scrapes Intel ARK for detailed CPU specifications."""
-        def fetch():
-            try:
-                q = up.quote(cpu_name)
-                search_url = f"https://ark.intel.com/content/www/us/en/ark/search.html?q={q}"
-                soup = BeautifulSoup(self._http_get(search_url).text, "html.parser")
-                # Find the first product link
-                href = next((h for a in soup.select("a") if "/products/" in (h := a.get("href", "")) and h.endswith(".html")), None)
-                if not href:
-                    return self._wikipedia_summary(cpu_name)
-
-                href = href if href.startswith("http") else f"https://ark.intel.com{href}"
-                psoup = BeautifulSoup(self._http_get(href).text, "html.parser")
-                specs = {normspace(dt_el.get_text()): normspace(dt_el.find_next_sibling("dd").get_text())
-                         for dt_el in psoup.select("dt") if dt_el.find_next_sibling("dd")}
-                if not specs:
-                    for tr in psoup.select("table tr"):
-                        if len(tds := tr.find_all(["td", "th"])) >= 2:
-                            specs[normspace(tds[0].get_text())] = normspace(tds[1].get_text())
-
-                # A list of desired fields to extract, to keep the output clean
-                wanted = {"Total Cores", "Total Threads", "Max Turbo Frequency", "Processor Base Frequency",
-                          "Cache", "Bus Speed", "TDP", "Lithography", "Max Memory Size", "Memory Types",
-                          "Max # of PCI Express Lanes", "Processor Graphics"}
-                filtered = {k: v for k, v in specs.items() if k in wanted}
-                title = normspace(psoup.title.get_text()) if psoup.title else cpu_name
-                return {"source": "intel_ark", "official_url": href, "fields": filtered or specs or {"title": title}}
-            except Exception:
-                return self._wikipedia_summary(cpu_name)
-        return self._cache_or_fetch_json(f"intel:{cpu_name}", fetch)
-
-    def _techpowerup_gpu_specs(self, gpu_name: str) -> Dict[str, Any]:
+        try:
+            q = up.quote(cpu_name)
+            # The autocomplete endpoint returns a few KB of JSON instead of a full search page
+            search_url = f"https://ark.intel.com/libs/apps/intel/support/ark/autocomplete?input={q}"
+            results = json.loads((yield search_url))
+            # Expected shape: a JSON array of suggestion objects whose "productUrl" links the
+            # product page. This is the shape the endpoint was specified with when it replaced
+            # the search page; no recorded response is checked in, so anything else is a miss.
+            if not isinstance(results, list) or not results:
+                return {}
+            first = results[0]
+            if not isinstance(first, dict):
+                return {}
+            href = first.get("productUrl")
+            if not href:
+                return {}
+
+            href = href if href.startswith("http") else f"https://ark.intel.com{href}"
+            psoup = parse_html((yield href))
+            specs = extract_specs(psoup, WANTED_CPU)
+            title = normspace(node_text(t)) if (t := css_first(psoup, "title")) else cpu_name
+            return {"source": "intel_ark", "official_url": href, "fields": specs or {"title": title}}
+        except Exception:
+            return {}
+
+    def _techpowerup_flow(self, gpu_name: str) -> SpecFlow:
         """Scrapes TechPowerUp for detailed GPU specifications."""
-        def fetch():
-            try:
-                q = up.quote(gpu_name)
-                search_url = f"https://www.techpowerup.com/search/?q={q}"
-                soup = BeautifulSoup(self._http_get(search_url).text, "html.parser")
-                # Find the first GPU spec page link
-                href = next((h for a in soup.select("a") if "/gpu-specs/" in (h := a.get("href", "")) and h.endswith(".html")), None)
-                if not href:
-                    return self._wikipedia_summary(gpu_name)
-
-                href = href if href.startswith("http") else f"https://www.techpowerup.com{href}"
-                psoup = BeautifulSoup(self._http_get(href).text, "html.parser")
-                specs = {}
-                for tr in psoup.select("table tr"):
-                    if len(tds := tr.find_all(["td", "th"])) >= 2:
-                        specs[normspace(tds[0].get_text())] = normspace(tds[1].get_text())
-                
-                # A list of desired fields to extract
-                wanted = {"GPU Name", "GPU Variant", "Architecture", "Foundry", "Process Size", "TDP", "Transistors",
-                          "Die Size", "Base Clock", "Boost Clock", "Memory Size", "Memory Type", "Memory Bus",
-                          "Bandwidth", "Release Date"}
-                filtered = {k: v for k, v in specs.items() if k in wanted}
-                title = normspace(psoup.title.get_text()) if psoup.title else gpu_name
-                return {"source": "techpowerup", "official_url": href, "fields": filtered or specs or {"title": title}}
-            except Exception:
-                return self._wikipedia_summary(gpu_name)
-        return self._cache_or_fetch_json(f"tpu:{gpu_name}", fetch)
+        try:
+            q = up.quote(gpu_name)
+            search_url = f"https://www.techpowerup.com/search/?q={q}"
+            soup = parse_html((yield search_url))
+            # Find the first GPU spec page link; the selector engine does the matching
+            href = node_attr(a, "href") if (a := css_first(soup, 'a[href*="/gpu-specs/"][href$=".html"]')) else None
+            if not href:
+                return {}
+
+            href = href if href.startswith("http") else f"https://www.techpowerup.com{href}"
+            psoup = parse_html((yield href))
+            specs = {}
+            for tr in css(psoup, "table tr"):
+                # Only read the value cell of rows whose label is wanted
+                if len(tds := css(tr, "td, th")) >= 2 and (key := normspace(node_text(tds[0]))) in WANTED_GPU:
+                    specs[key] = normspace(node_text(tds[1]))
+            title = normspace(node_text(t)) if (t := css_first(psoup, "title")) else gpu_name
+            return {"source": "techpowerup", "official_url": href, "fields": specs or {"title": title}}
+        except Exception:
+            return {}
+
+    def _cpu_sources(self, cpu: CPUInfo) -> List[SpecSource]:
+        """Orders CPU lookups: Intel ARK for Intel CPUs, then Wikipedia."""
+        name = cpu.name
+        vendor = f"{cpu.manufacturer} {name}".lower()
+        sources: List[SpecSource] = []
+        if "intel" in vendor:
+            sources.append((f"intel:v2:{name}", lambda: self._intel_ark_flow(name)))
+        sources.append((f"wikipedia:{name}", lambda: self._wikipedia_flow(name)))
+        return sources
+
+    def _gpu_sources(self, gpu: GPUInfo) -> List[SpecSource]:
+        """Orders GPU lookups: TechPowerUp (covers every vendor), then Wikipedia."""
+        name = gpu.name
+        sources: List[SpecSource] = []
+        sources.append((f"tpu:{name}", lambda: self._techpowerup_flow(name)))
+        sources.append((f"wikipedia:{name}", lambda: self._wikipedia_flow(name)))
+        return sources
+
+    def _wants_cpu(self, cpu: Optional[CPUInfo]) -> bool:
+        """Checks whether the CPU should be enriched under the current policy."""
+        if not (cpu and cpu.name) or self.enrich_policy == "never":
+            return False
+        return self.enrich_policy == "always" or not (cpu.max_clock_mhz and cpu.cores and cpu.threads)
+
+    def _wants_gpu(self, gpu: GPUInfo) -> bool:
+        """Checks whether a GPU should be enriched under the current policy."""
+        if not gpu.name or self.enrich_policy == "never":
+            return False
+        return self.enrich_policy == "always" or not gpu.adapter_ram
+
+    def _cpu_specs(self, cpu: CPUInfo) -> Dict[str, Any]:
+        """Looks up online CPU specifications, first non-empty source wins."""
+        return self._lookup(self._cpu_sources(cpu))
+
+    def _gpu_specs(self, gpu: GPUInfo) -> Dict[str, Any]:
+        """Looks up online GPU specifications, first non-empty source wins."""
+        return self._lookup(self._gpu_sources(gpu))
+
+    @staticmethod
+    def _wmi_query(wmi_class: str, fields: tuple, where: str = "") -> List[SimpleNamespace]:
+        """Runs one projected WQL query on the calling thread and returns plain rows.
+
+        COM proxies are bound to the thread that created them, so each worker
+        initializes COM, opens its own connection and copies the requested
+        properties out before uninitializing.
+        """
+        pythoncom.CoInitialize()
+        try:
+            return HardwareReporter._wmi_rows(win32com.client.GetObject(WMI_NAMESPACE), wmi_class, fields, where)
+        finally:
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _wmi_rows(conn: Any, wmi_class: str, fields: tuple, where: str = "") -> List[SimpleNamespace]:
+        """Runs one projected WQL query on an open connection and copies out the rows."""
+        wql = f"SELECT {', '.join(fields)} FROM {wmi_class}" + (f" WHERE {where}" if where else "")
+        rows = []
+        for o in conn.ExecQuery(wql, "WQL", WBEM_FLAGS):
+            props = o.Properties_
+            row = {}
+            for f in fields:
+                try:
+                    row[f] = props(f).Value
+                except pywintypes.com_error:
+                    # Property not provided by this OS/driver version
+                    row[f] = None
+            rows.append(SimpleNamespace(**row))
+        return rows
+
+    @staticmethod
+    def _wmi_query_nics() -> List[SimpleNamespace]:
+        """Reads physical NICs and their IP configuration on a single connection.
+
+        Each NIC row gets an IPAddress attribute joined from its configuration by
+        Index. Two set-based queries are cheaper than an ASSOCIATORS OF query per
+        adapter, which would cost one extra round-trip for every NIC.
+        """
+        pythoncom.CoInitialize()
+        try:
+            conn = win32com.client.GetObject(WMI_NAMESPACE)
+            nics = HardwareReporter._wmi_rows(conn, *WMI_NIC_QUERY)
+            ips = {c.Index: c.IPAddress for c in HardwareReporter._wmi_rows(conn, *WMI_NIC_CONFIG_QUERY)}
+            del conn
+            for n in nics:
+                n.IPAddress = ips.get(n.Index)
+            return nics
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _wmi_collect_all(self) -> Dict[str, List[SimpleNamespace]]:
+        """Fires every WMI query concurrently; a failed query yields an empty list.
+
+        If every query fails, WMI itself is unavailable (access denied, service
+        down), so the first error is re-raised instead of returning an empty report.
+        """
+        results: Dict[str, List[SimpleNamespace]] = {}
+        errors: List[Exception] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(WMI_QUERIES) + 1) as ex:
+            futures = {ex.submit(self._wmi_query, *q): key for key, q in WMI_QUERIES.items()}
+            futures[ex.submit(self._wmi_query_nics)] = "nics"
+            for f in concurrent.futures.as_completed(futures):
+                try:
+                    results[futures[f]] = f.result()
+                except Exception as e:
+                    errors.append(e)
+                    results[futures[f]] = []
+        if len(errors) == len(futures):
+            raise errors[0]
+        return results
 
     def collect_local(self) -> Report:
         """Gathers all local hardware information from WMI. Gracefully handles errors."""
         rep = Report()
-        # Using a list of WMI queries to streamline data collection
-        wmi_queries = {
-            "os": "Win32_OperatingSystem",
-            "cpu": "Win32_Processor",
-            "gpus": "Win32_VideoController",
-            "memory": "Win32_PhysicalMemory",
-            "disks": "Win32_DiskDrive",
-            "motherboard": "Win32_BaseBoard",
-            "bios": "Win32_BIOS",
-            "nics": "Win32_NetworkAdapter"
-        }
+        wq = self._wmi_collect_all()
 
         # OS info
         try:
-            os_data = self.wmi_c.Win32_OperatingSystem()[0]
+            os_data = wq["os"][0]
             rep.os = OSInfo(
                 caption=normspace(os_data.Caption),
                 version=str(os_data.Version or ""),
                 build=str(os_data.BuildNumber or ""),
                 arch=str(os_data.OSArchitecture or ""),
-                install_date=str(os_data.InstallDate or "")
+                install_date=_cim_dt(os_data.InstallDate)
             )
         except Exception:
             pass
         
         # CPU info
         try:
-            cpu_data = self.wmi_c.Win32_Processor()[0]
+            cpu_data = wq["cpu"][0]
             rep.cpu = CPUInfo(
                 name=normspace(cpu_data.Name),
                 manufacturer=normspace(cpu_data.Manufacturer),
@@ -353,17 +820,19 @@ class HardwareReporter:
         
         # GPUs info
         try:
-            rep.gpus = [
-                GPUInfo(
+            for g in wq["gpus"]:
+                pnp = str(g.PNPDeviceID or "")
+                ven = _VEN_RE.search(pnp)
+                dev = _DEV_RE.search(pnp)
+                rep.gpus.append(GPUInfo(
                     name=normspace(g.Name),
                     driver_version=str(g.DriverVersion or ""),
-                    vendor_id=re.search(r"VEN_([0-9A-F]{4})", g.PNPDeviceID, re.I).group(1).upper() if g.PNPDeviceID else None,
-                    device_id=re.search(r"DEV_([0-9A-F]{4})", g.PNPDeviceID, re.I).group(1).upper() if g.PNPDeviceID else None,
-                    adapter_ram=int(g.AdapterRAM) if g.AdapterRAM and int(g.AdapterRAM) > 0 else None,
-                    driver_date=str(g.DriverDate or ""),
-                    pnp_device_id=str(g.PNPDeviceID or "")
-                ) for g in self.wmi_c.Win32_VideoController()
-            ]
+                    vendor_id=ven.group(1).upper() if ven else None,
+                    device_id=dev.group(1).upper() if dev else None,
+                    adapter_ram=ram if (ram := safe_int(g.AdapterRAM)) and ram > 0 else None,
+                    driver_date=_cim_dt(g.DriverDate),
+                    pnp_device_id=pnp
+                ))
         except Exception:
             pass
 
@@ -371,14 +840,14 @@ class HardwareReporter:
         try:
             rep.memory = [
                 MemoryModule(
-                    capacity_bytes=int(m.Capacity) if m.Capacity is not None else None,
+                    capacity_bytes=safe_int(m.Capacity),
                     speed_mhz=safe_int(m.Speed),
                     manufacturer=normspace(m.Manufacturer),
                     part_number=normspace(m.PartNumber),
                     serial=normspace(m.SerialNumber),
                     form_factor=safe_int(m.FormFactor),
                     memory_type=safe_int(m.MemoryType)
-                ) for m in self.wmi_c.Win32_PhysicalMemory()
+                ) for m in wq["memory"]
             ]
         except Exception:
             pass
@@ -388,18 +857,18 @@ class HardwareReporter:
             rep.disks = [
                 DiskInfo(
                     model=normspace(d.Model),
-                    serial=normspace(getattr(d, "SerialNumber", "")),
-                    size_bytes=int(d.Size) if d.Size is not None else None,
+                    serial=normspace(d.SerialNumber),
+                    size_bytes=safe_int(d.Size),
                     interface_type=normspace(d.InterfaceType),
-                    media_type=normspace(getattr(d, "MediaType", ""))
-                ) for d in self.wmi_c.Win32_DiskDrive()
+                    media_type=normspace(d.MediaType)
+                ) for d in wq["disks"]
             ]
         except Exception:
             pass
         
         # Motherboard info
         try:
-            mb = self.wmi_c.Win32_BaseBoard()[0]
+            mb = wq["motherboard"][0]
             rep.motherboard = MotherboardInfo(
                 product=normspace(mb.Product),
                 manufacturer=normspace(mb.Manufacturer),
@@ -410,31 +879,26 @@ class HardwareReporter:
 
         # BIOS info
         try:
-            bios = self.wmi_c.Win32_BIOS()[0]
+            bios = wq["bios"][0]
             rep.bios = BIOSInfo(
                 version=normspace(bios.SMBIOSBIOSVersion),
                 serial=normspace(bios.SerialNumber),
-                release_date=str(bios.ReleaseDate or "")
+                release_date=_cim_dt(bios.ReleaseDate)
             )
         except Exception:
             pass
         
         # NICs info
         try:
-            nics_by_index = {
-                n.Index: NICInfo(
+            rep.nics = [
+                NICInfo(
                     name=normspace(n.Name),
                     mac=str(n.MACAddress or ""),
                     manufacturer=normspace(n.Manufacturer),
                     status=str(n.NetConnectionStatus) if n.NetConnectionStatus is not None else "",
-                    ip4=[]
-                ) for n in self.wmi_c.Win32_NetworkAdapter(PhysicalAdapter=True)
-            }
-            # Collect IPv4 addresses from a separate WMI class
-            for conf in self.wmi_c.Win32_NetworkAdapterConfiguration(IPEnabled=True):
-                if nic := nics_by_index.get(conf.Index):
-                    nic.ip4 = [ip for ip in (conf.IPAddress or []) if ":" not in ip]
-            rep.nics = list(nics_by_index.values())
+                    ip4=[ip for ip in (n.IPAddress or []) if ":" not in ip]
+                ) for n in wq["nics"]
+            ]
         except Exception:
             pass
 
@@ -447,18 +911,14 @@ class HardwareReporter:
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as ex:
             futures = []
-            # Submit CPU enrichment task
-            if rep.cpu and rep.cpu.name:
-                # Use a simple check to determine if it's an Intel CPU
-                if "intel" in rep.cpu.manufacturer.lower() or rep.cpu.name.lower().startswith("intel "):
-                    futures.append(ex.submit(lambda: ("cpu", self._intel_ark_specs(rep.cpu.name))))
-                else:
-                    futures.append(ex.submit(lambda: ("cpu", self._wikipedia_summary(rep.cpu.name))))
-            
+            # Submit CPU enrichment task, routed to the vendor's own site
+            if self._wants_cpu(rep.cpu):
+                futures.append(ex.submit(lambda: ("cpu", self._cpu_specs(rep.cpu))))
+
             # Submit GPU enrichment tasks for each detected GPU
             for i, gpu in enumerate(rep.gpus):
-                if gpu.name:
-                    futures.append(ex.submit(lambda gpu_name=gpu.name, i=i: (f"gpu{i}", self._techpowerup_gpu_specs(gpu_name))))
+                if self._wants_gpu(gpu):
+                    futures.append(ex.submit(lambda gpu=gpu, i=i: (f"gpu{i}", self._gpu_specs(gpu))))
 
             # Collect results as they complete
             for f in concurrent.futures.as_completed(futures):
@@ -470,21 +930,51 @@ class HardwareReporter:
 
         return rep
 
+    async def enrich_online_async(self, rep: Report, online: bool = True) -> Report:
+        """Runs online enrichment tasks concurrently on one aiohttp session."""
+        if not online:
+            return rep
+
+        sources: Dict[str, List[SpecSource]] = {}
+        if self._wants_cpu(rep.cpu):
+            sources["cpu"] = self._cpu_sources(rep.cpu)
+        for i, gpu in enumerate(rep.gpus):
+            if self._wants_gpu(gpu):
+                sources[f"gpu{i}"] = self._gpu_sources(gpu)
+        if not sources:
+            return rep
+
+        headers = {k: v for k, v in self.session.headers.items() if k not in ("Accept-Encoding", "Connection")}
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_workers, ttl_dns_cache=300)
+        self._aio_sem = asyncio.Semaphore(self.max_workers)
+        async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                         timeout=aiohttp.ClientTimeout(total=self.timeout)) as self.aio_session:
+            results = await asyncio.gather(*(self._lookup_async(v) for v in sources.values()), return_exceptions=True)
+            for k, v in zip(sources, results):
+                if isinstance(v, Exception):
+                    continue
+                rep.online[k] = OnlineSpec(**v)
+
+        self.aio_session = None
+        return rep
+
 # --- Rendering Logic ---
 
 def render_compact(rep: Report):
     """Renders a compact, build-sheet style report with Rich coloring."""
     theme = Theme({"hdr": "bold red", "label": "bold red", "value": "white"})
     console = Console(theme=theme)
+    # Renderables are collected and printed as one Group: a single lock/measure/write pass
+    out: List[Any] = []
     header = Text(f"{APP_NAME} — Hardware Online Check", style="hdr")
-    console.print(Panel.fit(header, border_style="white"))
+    out.append(Panel.fit(header, border_style="white"))
 
     def print_line(label: str, value: str):
         """Helper to print a single line with colored labels."""
         t = Text()
         t.append(f"{label}: ", style="label")
         t.append(value, style="value")
-        console.print(t)
+        out.append(t)
 
     if rep.cpu:
         cpu_value = rep.cpu.name or "N/A"
@@ -496,10 +986,10 @@ def render_compact(rep: Report):
         on_cpu = rep.online.get("cpu")
         if on_cpu and on_cpu.fields:
             if base := on_cpu.fields.get("Processor Base Frequency") or on_cpu.fields.get("Base Clock"):
-                if m := re.search(r"([\d\.]+)\s*GHz", base, re.I):
+                if m := _GHZ_RE.search(base):
                     extras.append(f"{m.group(1)} GHz base")
             if boost := on_cpu.fields.get("Max Turbo Frequency") or on_cpu.fields.get("Boost Clock"):
-                if m := re.search(r"([\d\.]+)\s*GHz", boost, re.I):
+                if m := _GHZ_RE.search(boost):
                     extras.append(f"boost up to {m.group(1)} GHz")
             if cache := on_cpu.fields.get("Cache"):
                 extras.append(cache)
@@ -529,11 +1019,11 @@ def render_compact(rep: Report):
         print_line("GPU", gdesc)
 
     if rep.disks:
-        console.print(Text("STORAGE:", style="label"))
+        out.append(Text("STORAGE:", style="label"))
         for d in rep.disks:
             size = bytes_to_human(d.size_bytes)
             parts = [p for p in [d.model, f"({size})" if size else "", d.interface_type or "", d.media_type or ""] if p]
-            console.print(Text("- ", style="value").append(" ".join(parts), style="value"))
+            out.append(Text("- ", style="value").append(" ".join(parts), style="value"))
 
     if rep.nics:
         nics_names = [n.name for n in rep.nics if n.name]
@@ -546,12 +1036,15 @@ def render_compact(rep: Report):
             os_line += f" (Build {rep.os.build})"
         print_line("OS", os_line)
 
+    console.print(Group(*out))
+
 
 def render_tables(rep: Report):
     """Renders a detailed, tabular report with Rich formatting."""
     theme = Theme({"info": "bold cyan", "hdr": "bold red", "dim": "dim"})
     console = Console(theme=theme)
-    console.print(Panel.fit(Text(f"{APP_NAME} — Detailed Report", style="hdr"), border_style="white"))
+    out: List[Any] = []
+    out.append(Panel.fit(Text(f"{APP_NAME} — Detailed Report", style="hdr"), border_style="white"))
 
     if rep.os:
         t = Table(box=box.SIMPLE_HEAVY, title="Operating System")
@@ -563,7 +1056,7 @@ def render_tables(rep: Report):
         t.add_row("Version", f"{rep.os.version} (Build {rep.os.build})")
         if rep.os.install_date:
             t.add_row("Installed", rep.os.install_date)
-        console.print(Panel(t, border_style="green"))
+        out.append(Panel(t, border_style="green"))
 
     if rep.cpu:
         t = Table(box=box.SIMPLE_HEAVY, title="CPU")
@@ -581,7 +1074,7 @@ def render_tables(rep: Report):
             t.add_row("Online Spec", on.official_url)
             for k, v in on.fields.items():
                 t.add_row(k, str(v))
-        console.print(Panel(t, border_style="yellow"))
+        out.append(Panel(t, border_style="yellow"))
 
     for idx, g in enumerate(rep.gpus):
         t = Table(box=box.SIMPLE_HEAVY, title=f"GPU #{idx+1}")
@@ -602,7 +1095,7 @@ def render_tables(rep: Report):
             t.add_row("Online Spec", on.official_url)
             for k, v in on.fields.items():
                 t.add_row(k, str(v))
-        console.print(Panel(t, border_style="blue"))
+        out.append(Panel(t, border_style="blue"))
 
     if rep.memory:
         t = Table(box=box.SIMPLE_HEAVY, title="Memory Modules")
@@ -614,7 +1107,7 @@ def render_tables(rep: Report):
         t.add_column("Serial")
         for i, m in enumerate(rep.memory, 1):
             t.add_row(str(i), bytes_to_human(m.capacity_bytes), str(m.speed_mhz or ""), m.manufacturer, m.part_number, m.serial)
-        console.print(Panel(t, border_style="magenta"))
+        out.append(Panel(t, border_style="magenta"))
 
     if rep.disks:
         t = Table(box=box.SIMPLE_HEAVY, title="Disk Drives")
@@ -626,7 +1119,7 @@ def render_tables(rep: Report):
         t.add_column("Media Type")
         for i, d in enumerate(rep.disks, 1):
             t.add_row(str(i), d.model, d.serial, bytes_to_human(d.size_bytes), d.interface_type, d.media_type)
-        console.print(Panel(t, border_style="cyan"))
+        out.append(Panel(t, border_style="cyan"))
 
     if rep.motherboard or rep.bios:
         t = Table(box=box.SIMPLE_HEAVY, title="Motherboard / BIOS")
@@ -643,7 +1136,7 @@ def render_tables(rep: Report):
                 t.add_row("BIOS Release", rep.bios.release_date)
             if rep.bios.serial:
                 t.add_row("BIOS Serial", rep.bios.serial)
-        console.print(Panel(t, border_style="white"))
+        out.append(Panel(t, border_style="white"))
 
     if rep.nics:
         t = Table(box=box.SIMPLE_HEAVY, title="Network Adapters")
@@ -655,7 +1148,9 @@ def render_tables(rep: Report):
         t.add_column("IPv4")
         for i, n in enumerate(rep.nics, 1):
             t.add_row(str(i), n.name, n.mac, n.manufacturer, n.status, ", ".join(n.ip4))
-        console.print(Panel(t, border_style="bright_black"))
+        out.append(Panel(t, border_style="bright_black"))
+
+    console.print(Group(*out))
 
 # --- Main Logic ---
 
@@ -666,6 +1161,8 @@ def main():
     )
     parser.add_argument("--json", dest="json_out", help="Write a full JSON report to a file.")
     parser.add_argument("--no-online", action="store_true", help="Skip online lookups (offline mode).")
+    parser.add_argument("--only-missing", action="store_true",
+                        help="Only look up components whose local WMI data is incomplete.")
     parser.add_argument("--timeout", type=int, default=12, help="HTTP timeout per request (in seconds).")
     parser.add_argument("--max-workers", type=int, default=min(4, (os.cpu_count() or 4)),
                         help="Max concurrent HTTP workers.")
@@ -673,6 +1170,8 @@ def main():
     parser.add_argument("--table", action="store_true", help="Show a detailed tabular view instead of the compact one.")
     parser.add_argument("--compact", action="store_true", help="Force the compact view (default).")
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
 
     # Determine which view to display
     show_compact = True if args.compact or not args.table else False
@@ -680,24 +1179,31 @@ def main():
     if os.name != "nt":
         print("[WARN] This tool targets Windows (WMI). Some information may be unavailable.", file=sys.stderr)
 
+    enrich_policy = "never" if args.no_online else "missing" if args.only_missing else "always"
+    reporter = HardwareReporter(timeout=args.timeout, max_workers=args.max_workers, enrich_policy=enrich_policy)
     if args.refresh_cache:
-        CACHE.invalidate()
-
-    reporter = HardwareReporter(timeout=args.timeout, max_workers=args.max_workers)
+        reporter.cache_clear()
 
     try:
         # Collect local data first
         rep = reporter.collect_local()
         # Then enrich it with online data
-        rep = reporter.enrich_online(rep, online=not args.no_online)
-    except wmi.x_wmi:
+        if aiohttp is not None:
+            rep = asyncio.run(reporter.enrich_online_async(rep, online=not args.no_online))
+        else:
+            rep = reporter.enrich_online(rep, online=not args.no_online)
+    except pywintypes.com_error:
         print("[FATAL] WMI error. Please run the script as an Administrator.", file=sys.stderr)
         sys.exit(1)
 
     # Optional JSON dump
     if args.json_out:
-        with open(args.json_out, "w", encoding="utf-8") as f:
-            json.dump(asdict(rep), f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(args.json_out, "wb") as f:
+                f.write(orjson.dumps(rep, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(args.json_out, "w", encoding="utf-8") as f:
+                json.dump(asdict(rep), f, ensure_ascii=False, indent=2)
 
     # Render the report
     if show_compact:
@@ -0,0 +1,16 @@
+import importlib.util
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# HWOC exits at import time without pywin32, which only exists on Windows. The helpers
+# under test never touch COM, so off Windows register empty placeholders for the
+# pywin32 modules; collect_local is not exercised here.
+if importlib.util.find_spec("pythoncom") is None:
+    for name in ("pythoncom", "pywintypes", "win32com", "win32com.client"):
+        sys.modules.setdefault(name, types.ModuleType(name))
+    sys.modules["pywintypes"].com_error = OSError
@@ -0,0 +1,146 @@
+import time
+
+import pytest
+
+import HWOC
+
+
+@pytest.fixture(params=["lexbor", "bs4"])
+def html_backend(request, monkeypatch):
+    """Runs a test against both HTML backends parse_html can pick."""
+    if request.param == "lexbor":
+        if HWOC.LexborHTMLParser is None:
+            pytest.skip("selectolax is not installed")
+    else:
+        monkeypatch.setattr(HWOC, "LexborHTMLParser", None)
+    return request.param
+
+
+# --- normspace / safe_int / bytes_to_human / _cim_dt ---
+
+@pytest.mark.parametrize("raw, expected", [
+    ("  Intel(R)\t Core(TM)\n i7  ", "Intel(R) Core(TM) i7"),
+    ("N/A", "N/A"),
+    ("", ""),
+    (None, ""),
+])
+def test_normspace(raw, expected):
+    assert HWOC.normspace(raw) == expected
+    # Memoized, and idempotent on already-normalized input
+    assert HWOC.normspace(HWOC.normspace(raw)) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (5, 5),
+    ("17179869184", 17179869184),
+    (None, None),
+    ("abc", None),
+    ([1], None),
+])
+def test_safe_int(raw, expected):
+    assert HWOC.safe_int(raw) == expected
+
+
+@pytest.mark.parametrize("n, expected", [
+    (None, ""),
+    (0, ""),
+    (-1, ""),
+    (1023, "1023.0 B"),
+    (1024, "1.0 KiB"),
+    (16 * 1024 ** 3, "16.0 GiB"),
+    (1000204886016, "931.5 GiB"),
+    (1024 ** 5, "1024.0 TiB"),
+])
+def test_bytes_to_human(n, expected):
+    assert HWOC.bytes_to_human(n) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("20230115000000.000000+000", "2023-01-15"),
+    ("20191231", "20191231"),
+    ("", ""),
+    (None, ""),
+])
+def test_cim_dt(raw, expected):
+    assert HWOC._cim_dt(raw) == expected
+
+
+# --- extract_specs ---
+
+DL_PAGE = """
+<html><body>
+<table><tr><td>Row</td><td>ignored when a dl exists</td></tr></table>
+<dl>
+  <dt>Total Cores</dt><dd> 8 </dd>
+  <dt>Cache</dt><dd>12 MB <sup>Intel&reg; Smart Cache</sup></dd>
+  <dt>Lithography</dt><dd>14 nm</dd>
+</dl>
+</body></html>
+"""
+
+
+def test_selector_list_is_document_order(html_backend):
+    tree = HWOC.parse_html(DL_PAGE)
+    assert [HWOC.node_tag(el) for el in HWOC.css(tree, "dt, dd, tr")] == ["tr", "dt", "dd", "dt", "dd", "dt", "dd"]
+
+
+def test_extract_specs_pairs_dt_dd(html_backend):
+    specs = HWOC.extract_specs(HWOC.parse_html(DL_PAGE))
+    assert specs == {"Total Cores": "8", "Cache": "12 MB Intel® Smart Cache", "Lithography": "14 nm"}
+
+
+def test_extract_specs_filters_and_exits_early(html_backend, monkeypatch):
+    calls = []
+    node_text = HWOC.node_text
+
+    def counting_node_text(node):
+        calls.append(node)
+        return node_text(node)
+
+    monkeypatch.setattr(HWOC, "node_text", counting_node_text)
+    tree = HWOC.parse_html(DL_PAGE)
+    specs = HWOC.extract_specs(tree, {"Total Cores"})
+    assert specs == {"Total Cores": "8"}
+    # The leading table row, then one <dt> and one <dd>: the walk stops once every
+    # wanted label is paired, before reading the remaining <dt>s
+    assert len(calls) == 3
+
+
+def test_extract_specs_table_fallback(html_backend):
+    page = "<table><tr><th>GPU Name</th><td>AD102</td><td>extra</td></tr><tr><td>Junk</td><td>x</td></tr></table>"
+    tree = HWOC.parse_html(page)
+    assert HWOC.extract_specs(tree) == {"GPU Name": "AD102", "Junk": "x"}
+    assert HWOC.extract_specs(tree, {"GPU Name"}) == {"GPU Name": "AD102"}
+
+
+# --- DiskCache ---
+
+def test_disk_cache_roundtrip(tmp_path):
+    root = tmp_path / "hwoc"
+    cache = HWOC.DiskCache(root)
+    assert cache.get("intel:v2:cpu") is None
+    assert not root.exists()  # created lazily on the first write
+
+    cache.set("intel:v2:cpu", {"source": "intel_ark"}, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    entry = cache.get("intel:v2:cpu")
+    assert entry["payload"] == {"source": "intel_ark"}
+    assert entry["etag"] == '"v1"'
+    assert entry["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert cache.is_fresh(entry)
+
+    cache.invalidate()
+    assert cache.get("intel:v2:cpu") is None
+
+
+def test_disk_cache_is_fresh_honours_ttl(tmp_path):
+    cache = HWOC.DiskCache(tmp_path, ttl=60)
+    assert not cache.is_fresh(None)
+    assert cache.is_fresh({"fetched_at": time.time() - 30, "payload": {}})
+    assert not cache.is_fresh({"fetched_at": time.time() - 120, "payload": {}})
+
+
+def test_disk_cache_ignores_corrupt_entries(tmp_path):
+    cache = HWOC.DiskCache(tmp_path)
+    cache.set("k", "body")
+    cache._path("k").write_text("{not json", encoding="utf-8")
+    assert cache.get("k") is None